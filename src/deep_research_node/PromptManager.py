@@ -11,13 +11,69 @@ import os
 import yaml
 import hashlib
 import re
+import sys
+import json
+import string
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-import frontmatter
+from packaging.version import InvalidVersion, Version
 
 
-@dataclass
+_FORMATTER = string.Formatter()
+
+# Rendered prompts kept per template; long values (e.g. page content) aren't worth keeping
+_RENDER_CACHE_SIZE = 16
+_RENDER_CACHE_MAX_VALUE = 1024
+_RENDER_CACHE_LOCK = threading.Lock()
+
+# Parsed prompts are persisted here, inside the prompts directory. The file is
+# plain JSON, so a tampered cache can at worst serve wrong prompt text.
+_INDEX_FILENAME = ".prompt_cache.json"
+_INDEX_FORMAT = 1
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings; leave any other YAML value untouched."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _version_key(version: str) -> Tuple[int, Any]:
+    """Sort key for version names like ``v1.10.0``; unparseable names sort first."""
+    try:
+        return (1, Version(version.lstrip('v')))
+    except InvalidVersion:
+        return (0, version)
+
+
+def _read_prompt_file(file_path: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Split a prompt file into its front-matter metadata and content.
+    
+    Handles the plain ``---`` delimited header directly on the raw bytes and
+    falls back to python-frontmatter for anything else.
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    
+    if raw.startswith(b"---\n"):
+        end = raw.find(b"\n---\n", 3)
+        if end != -1:
+            metadata = yaml.load(raw[4:end], Loader=_YAML_LOADER) or {}
+            return metadata, raw[end + 5:].decode("utf-8")
+    
+    import frontmatter
+    post = frontmatter.loads(raw.decode("utf-8"))
+    return post.metadata, post.content
+
+
+@dataclass(frozen=True, slots=True)
 class PromptTemplate:
     """Represents a versioned prompt template with metadata."""
     
@@ -27,24 +83,95 @@ class PromptTemplate:
     author: str
     date: str
     changes: str
-    tags: List[str]
-    model_hints: Dict[str, Any]
+    tags: Tuple[str, ...]
+    model_hints: Dict[str, Any] = field(hash=False)
     content_hash: str
     file_path: str
+    _parsed: Tuple[Tuple[str, Optional[str], Optional[str], Optional[str]], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _tags_csv: str = field(init=False, repr=False, compare=False)
+    _otel_attributes: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    _langfuse_metadata: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    _rendered: Dict[Tuple[Tuple[str, str], ...], str] = field(
+        init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        # Copy the loaded containers, interning the small shared vocabulary
+        # of tags and hint keys
+        object.__setattr__(self, "tags", tuple(_intern(tag) for tag in self.tags))
+        object.__setattr__(self, "model_hints", {
+            _intern(key): value for key, value in self.model_hints.items()
+        })
+        # Parse the format string once at load rather than on every render
+        object.__setattr__(self, "_parsed", tuple(_FORMATTER.parse(self.template)))
+        # Telemetry metadata never changes, so build it once
+        object.__setattr__(self, "_tags_csv", ",".join(self.tags))
+        object.__setattr__(self, "_otel_attributes", self._build_otel_attributes())
+        object.__setattr__(self, "_langfuse_metadata", self._build_langfuse_metadata())
+        object.__setattr__(self, "_rendered", {})
     
     def render(self, **kwargs) -> str:
         """Render the prompt template with provided variables."""
-        return self.template.format(**kwargs)
+        # Only plain short strings are memoized: other values can compare equal
+        # yet format differently (0.0 and -0.0), or change after being cached
+        if not all(type(v) is str and len(v) <= _RENDER_CACHE_MAX_VALUE for v in kwargs.values()):
+            return self._format(kwargs)
+        
+        key = tuple(sorted(kwargs.items()))
+        rendered = self._rendered.get(key)
+        if rendered is None:
+            rendered = self._format(kwargs)
+            with _RENDER_CACHE_LOCK:
+                if len(self._rendered) >= _RENDER_CACHE_SIZE:
+                    # Evict the oldest entry
+                    del self._rendered[next(iter(self._rendered))]
+                self._rendered[key] = rendered
+        return rendered
+    
+    def _format(self, kwargs: Dict[str, Any]) -> str:
+        """Fill the pre-parsed template, matching str.format semantics."""
+        parts = []
+        for literal, field_name, spec, conversion in self._parsed:
+            parts.append(literal)
+            if field_name is None:
+                continue
+            if field_name == "" or field_name[0] in "0123456789.[":
+                # Auto-numbered or positional field; no positional arguments are
+                # ever passed, as with str.format(**kwargs)
+                index = re.split(r"[.\[]", field_name, maxsplit=1)[0] or "0"
+                raise IndexError(f"Replacement index {index} out of range for positional args tuple")
+            if field_name in kwargs:
+                value = kwargs[field_name]
+            else:
+                # Attribute/index lookups such as {item.name} or {items[0]}
+                value, _ = _FORMATTER.get_field(field_name, (), kwargs)
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            if spec and "{" in spec:
+                spec = _FORMATTER.vformat(spec, (), kwargs)
+            parts.append(format(value, spec or ""))
+        return "".join(parts)
     
     def get_otel_attributes(self) -> Dict[str, Any]:
         """Get OpenTelemetry attributes for this prompt."""
+        # Copy so callers can't alter the precomputed attributes
+        return dict(self._otel_attributes)
+    
+    def get_langfuse_metadata(self) -> Dict[str, Any]:
+        """Get Langfuse-specific metadata for enhanced UI visibility."""
+        return dict(self._langfuse_metadata)
+    
+    def _build_otel_attributes(self) -> Dict[str, Any]:
+        """Build OpenTelemetry attributes for this prompt."""
         attributes = {
             "prompt.name": self.name,
             "prompt.version": self.version,
             "prompt.author": self.author,
             "prompt.date": self.date,
             "prompt.hash": self.content_hash,
-            "prompt.tags": ",".join(self.tags),
+            "prompt.tags": self._tags_csv,
             "prompt.file": os.path.basename(self.file_path)
         }
         
@@ -54,17 +181,17 @@ class PromptTemplate:
         
         return attributes
     
-    def get_langfuse_metadata(self) -> Dict[str, Any]:
-        """Get Langfuse-specific metadata for enhanced UI visibility."""
+    def _build_langfuse_metadata(self) -> Dict[str, Any]:
+        """Build Langfuse-specific metadata for enhanced UI visibility."""
         return {
             "langfuse.metadata.prompt_name": self.name,
             "langfuse.metadata.prompt_version": self.version,
             "langfuse.metadata.prompt_author": self.author,
             "langfuse.metadata.prompt_date": self.date,
-            "langfuse.metadata.prompt_tags": ",".join(self.tags),
+            "langfuse.metadata.prompt_tags": self._tags_csv,
             "langfuse.metadata.prompt_hash": self.content_hash,
             # Add prompt name as a tag for easy filtering
-            "langfuse.tags": f"{self.name},{self.version}," + ",".join(self.tags)
+            "langfuse.tags": f"{self.name},{self.version},{self._tags_csv}"
         }
 
 
@@ -81,62 +208,220 @@ class PromptManager:
         self.prompts_dir = prompts_dir
         self.cache: Dict[str, Dict[str, PromptTemplate]] = {}
         self.manifest: Dict[str, Any] = {}
-        self._load_manifest()
-        self._load_all_prompts()
+        self._paths: Dict[str, Dict[str, str]] = {}
+        self._latest: Dict[str, str] = {}
+        self._sources: Dict[str, int] = {}
+        # Guards cache updates and cache-file writes; nodes may run in worker threads
+        self._lock = threading.Lock()
+        self._load()
+    
+    def _load(self) -> None:
+        """Load the manifest and prompt index, preferring the on-disk cache."""
+        self._sources = self._get_sources()
+        # A current cache file leaves nothing new to save
+        self._index_pending = not self._load_index()
+        if self._index_pending:
+            self._load_manifest()
+            self._index_prompts()
+    
+    def _get_sources(self) -> Dict[str, int]:
+        """
+        Map every directory and file under the prompts directory to its mtime (ns).
+        
+        The cache file itself is left out, so writing it doesn't invalidate it;
+        added, removed or renamed entries still change the result.
+        """
+        sources = {}
+        for root, dirs, files in os.walk(self.prompts_dir):
+            for name in dirs + files:
+                if name.startswith(_INDEX_FILENAME):
+                    continue
+                path = os.path.join(root, name)
+                sources[os.path.relpath(path, self.prompts_dir)] = os.stat(path).st_mtime_ns
+        return sources
+    
+    def _load_index(self) -> bool:
+        """
+        Restore the manifest and parsed prompts from the cache file.
+        
+        Returns:
+            True if a cache file matching the current prompt files was loaded
+        """
+        index_path = os.path.join(self.prompts_dir, _INDEX_FILENAME)
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get("format") != _INDEX_FORMAT or index.get("sources") != self._sources:
+                return False
+            manifest = index["manifest"]
+            # Paths are stored relative to the prompts directory
+            paths = {
+                name: {version: os.path.join(self.prompts_dir, path) for version, path in versions.items()}
+                for name, versions in index["paths"].items()
+            }
+            cache = {
+                name: {
+                    version: PromptTemplate(**{**record, "file_path": paths[name][version]})
+                    for version, record in versions.items()
+                }
+                for name, versions in index["prompts"].items()
+            }
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"⚠️  Ignoring prompt cache {index_path}: {e}")
+            return False
+        
+        self.manifest, self._paths, self.cache = manifest, paths, cache
+        return True
+    
+    def _write_index(self) -> None:
+        """Persist the manifest and parsed prompts for the next process."""
+        index_path = os.path.join(self.prompts_dir, _INDEX_FILENAME)
+        # Store paths relative to the prompts directory so the cache stays valid
+        # when the directory is opened from elsewhere
+        index = {
+            "format": _INDEX_FORMAT,
+            "sources": self._sources,
+            "manifest": self.manifest,
+            "paths": {
+                name: {version: os.path.relpath(path, self.prompts_dir) for version, path in versions.items()}
+                for name, versions in self._paths.items()
+            },
+            "prompts": {
+                name: {version: _template_record(template) for version, template in versions.items()}
+                for name, versions in self.cache.items()
+            },
+        }
+        
+        # Write to a unique temporary file first so readers never see a partial cache
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.prompts_dir, prefix=_INDEX_FILENAME, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                # YAML scalars JSON can't represent (e.g. unquoted dates) are stored as strings
+                json.dump(index, f, default=str)
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            print(f"⚠️  Could not write prompt cache {index_path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
     
     def _load_manifest(self) -> None:
         """Load the prompt manifest file."""
         manifest_path = os.path.join(self.prompts_dir, "manifest.yaml")
         if os.path.exists(manifest_path):
             with open(manifest_path, 'r') as f:
-                self.manifest = yaml.safe_load(f)
+                self.manifest = yaml.load(f, Loader=_YAML_LOADER)
         else:
             print(f"⚠️  No manifest found at {manifest_path}")
             self.manifest = {"prompts": {}, "settings": {}}
     
-    def _load_all_prompts(self) -> None:
-        """Load all prompts from the prompts directory."""
+    def _index_prompts(self) -> None:
+        """Record the prompt files on disk; they are parsed on first use."""
         prompts_config = self.manifest.get("prompts", {})
         
-        for prompt_name, config in prompts_config.items():
-            prompt_dir = os.path.join(self.prompts_dir, prompt_name)
-            if not os.path.exists(prompt_dir):
+        # One directory scan finds every prompt directory that exists
+        try:
+            with os.scandir(self.prompts_dir) as entries:
+                prompt_dirs = {
+                    entry.name: entry.path for entry in entries
+                    if entry.name in prompts_config and entry.is_dir()
+                }
+        except FileNotFoundError:
+            return
+        
+        for prompt_name in prompts_config:
+            prompt_dir = prompt_dirs.get(prompt_name)
+            if prompt_dir is None:
                 continue
             
+            self._paths[prompt_name] = {}
             self.cache[prompt_name] = {}
             
-            # Load all version files
-            for filename in os.listdir(prompt_dir):
-                if filename.endswith('.md'):
-                    version = filename.replace('.md', '')
-                    file_path = os.path.join(prompt_dir, filename)
-                    
-                    try:
-                        prompt_template = self._load_prompt_file(
-                            prompt_name, version, file_path
-                        )
-                        self.cache[prompt_name][version] = prompt_template
-                    except Exception as e:
-                        print(f"❌ Error loading {file_path}: {e}")
+            # Index all version files
+            with os.scandir(prompt_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.md') and entry.is_file():
+                        self._paths[prompt_name][entry.name[:-3]] = entry.path
+    
+    def _get_template(self, name: str, version: str) -> PromptTemplate:
+        """Return a cached template, loading it from disk on first access."""
+        template = self.cache[name].get(version)
+        if template is not None:
+            return template
+        
+        with self._lock:
+            # Another thread may have loaded it while we waited
+            template = self.cache[name].get(version)
+            if template is None:
+                file_path = self._paths[name][version]
+                try:
+                    template = self._load_prompt_file(name, version, file_path)
+                except Exception as e:
+                    print(f"❌ Error loading {file_path}: {e}")
+                    raise ValueError(
+                        f"Version '{version}' of prompt '{name}' could not be loaded"
+                    ) from e
+                self.cache[name][version] = template
+                self._write_index_if_complete()
+        return template
+    
+    def _write_index_if_complete(self) -> None:
+        """Once every indexed prompt is parsed, save them for the next process."""
+        if self._index_pending and all(
+            len(self.cache[name]) == len(versions) for name, versions in self._paths.items()
+        ):
+            # One attempt per load, so a read-only directory warns only once
+            self._index_pending = False
+            self._write_index()
+    
+    def preload(self) -> None:
+        """Parse every indexed prompt now instead of on first use."""
+        pending = [
+            (name, version, file_path)
+            for name, versions in self._paths.items()
+            for version, file_path in versions.items()
+            if version not in self.cache[name]
+        ]
+        if not pending:
+            return
+        
+        def load(item: Tuple[str, str, str]) -> Optional[PromptTemplate]:
+            try:
+                return self._load_prompt_file(*item)
+            except Exception as e:
+                print(f"❌ Error loading {item[2]}: {e}")
+                return None
+        
+        # Thread start-up isn't worth it for a handful of files
+        if len(pending) > 4:
+            workers = min(len(pending), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                templates = list(executor.map(load, pending))
+        else:
+            templates = [load(item) for item in pending]
+        
+        with self._lock:
+            for (name, version, _), template in zip(pending, templates):
+                if template is not None:
+                    self.cache[name].setdefault(version, template)
+            self._write_index_if_complete()
     
     def _load_prompt_file(self, name: str, version: str, file_path: str) -> PromptTemplate:
         """Load a single prompt file."""
-        with open(file_path, 'r') as f:
-            post = frontmatter.load(f)
-        
-        # Extract metadata
-        metadata = post.metadata
-        content = post.content.strip()
+        metadata, content = _read_prompt_file(file_path)
+        content = content.strip()
         
-        # Calculate content hash
-        content_hash = hashlib.sha256(content.encode()).hexdigest()[:12]
+        # Calculate content hash (an identifier, not a security boundary)
+        content_hash = hashlib.blake2b(content.encode(), digest_size=6).hexdigest()
         
         return PromptTemplate(
             name=name,
             version=version,
             template=content,
             author=metadata.get("author", "unknown"),
-            date=metadata.get("date", "unknown"),
+            date=str(metadata.get("date", "unknown")),
             changes=metadata.get("changes", ""),
             tags=metadata.get("tags", []),
             model_hints=metadata.get("model_hints", {}),
@@ -158,7 +443,7 @@ class PromptManager:
         Raises:
             ValueError: If prompt or version not found
         """
-        if name not in self.cache:
+        if name not in self._paths:
             raise ValueError(f"Prompt '{name}' not found")
         
         if version is None or version == "latest":
@@ -168,35 +453,37 @@ class PromptManager:
             
             if not version:
                 # Fallback to highest version number
-                versions = list(self.cache[name].keys())
-                if versions:
-                    version = sorted(versions)[-1]
-                else:
-                    raise ValueError(f"No versions found for prompt '{name}'")
+                version = self._latest.get(name)
+                if version is None:
+                    versions = self._paths[name]
+                    if not versions:
+                        raise ValueError(f"No versions found for prompt '{name}'")
+                    version = self._latest[name] = max(versions, key=_version_key)
         
-        if version not in self.cache[name]:
+        if version not in self._paths[name]:
             raise ValueError(f"Version '{version}' not found for prompt '{name}'")
         
-        return self.cache[name][version]
+        return self._get_template(name, version)
     
     def list_prompts(self) -> List[str]:
         """List all available prompt names."""
-        return list(self.cache.keys())
+        return list(self._paths.keys())
     
     def list_versions(self, name: str) -> List[str]:
         """List all versions for a specific prompt."""
-        if name not in self.cache:
+        if name not in self._paths:
             raise ValueError(f"Prompt '{name}' not found")
         
-        return sorted(list(self.cache[name].keys()))
+        return sorted(self._paths[name], key=_version_key)
     
     def get_changelog(self, name: str) -> Dict[str, str]:
         """Get version history for a prompt."""
-        if name not in self.cache:
+        if name not in self._paths:
             raise ValueError(f"Prompt '{name}' not found")
         
         changelog = {}
-        for version, template in self.cache[name].items():
+        for version in self._paths[name]:
+            template = self._get_template(name, version)
             changelog[version] = {
                 "date": template.date,
                 "author": template.author,
@@ -205,15 +492,30 @@ class PromptManager:
         
         return changelog
     
-    def compare_versions(self, name: str, version1: str, version2: str) -> Dict[str, Any]:
-        """Compare two versions of a prompt."""
+    def compare_versions(
+        self, name: str, version1: str, version2: str, full_diff: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Compare two versions of a prompt.
+        
+        Args:
+            name: Name of the prompt
+            version1: First version to compare
+            version2: Second version to compare
+            full_diff: Compare the full template text instead of content hashes
+        """
         prompt1 = self.get_prompt(name, version1)
         prompt2 = self.get_prompt(name, version2)
         
+        if full_diff:
+            content_changed = prompt1.template != prompt2.template
+        else:
+            content_changed = prompt1.content_hash != prompt2.content_hash
+        
         return {
             "version1": version1,
             "version2": version2,
-            "content_changed": prompt1.template != prompt2.template,
+            "content_changed": content_changed,
             "hash1": prompt1.content_hash,
             "hash2": prompt2.content_hash,
             "tags_added": list(set(prompt2.tags) - set(prompt1.tags)),
@@ -227,9 +529,50 @@ class PromptManager:
     
     def reload(self) -> None:
         """Reload all prompts from disk."""
-        self.cache.clear()
-        self._load_manifest()
-        self._load_all_prompts()
+        with self._lock:
+            self.cache = {}
+            self._paths = {}
+            self._latest = {}
+            self._load()
+
+
+def _template_record(template: PromptTemplate) -> Dict[str, Any]:
+    """Get the constructor arguments of a template as JSON-serializable values."""
+    record = {f.name: getattr(template, f.name) for f in fields(template) if f.init}
+    record["model_hints"] = dict(template.model_hints)
+    del record["file_path"]
+    return record
+
+
+# Process-wide managers, keyed by prompts directory
+_MANAGERS: Dict[str, PromptManager] = {}
+_MANAGERS_LOCK = threading.Lock()
+
+
+def get_prompt_manager(prompts_dir: str = "prompts") -> PromptManager:
+    """
+    Get the shared prompt manager for a prompts directory.
+    
+    The first call loads every prompt, from the prompt cache when it is
+    current, and saves that cache otherwise; subsequent calls return the same
+    instance. Use ``reload()`` to pick up changes.
+    
+    Args:
+        prompts_dir: Directory containing prompt files
+        
+    Returns:
+        PromptManager instance
+    """
+    manager = _MANAGERS.get(prompts_dir)
+    if manager is None:
+        # Nodes may ask for the manager from several worker threads at once
+        with _MANAGERS_LOCK:
+            manager = _MANAGERS.get(prompts_dir)
+            if manager is None:
+                manager = PromptManager(prompts_dir)
+                manager.preload()
+                _MANAGERS[prompts_dir] = manager
+    return manager
 
 
 # Convenience function for quick prompt loading
@@ -245,5 +588,5 @@ def load_prompt(name: str, version: Optional[str] = None, prompts_dir: str = "pr
     Returns:
         PromptTemplate instance
     """
-    manager = PromptManager(prompts_dir)
+    manager = get_prompt_manager(prompts_dir)
     return manager.get_prompt(name, version)
\ No newline at end of file
@@ -5,23 +5,32 @@ This module implements a research agent that can perform iterative web searches
 and synthesis to answer complex research questions.
 """
 
+from concurrent.futures import as_completed
+from functools import lru_cache
+
 from pydantic import BaseModel, Field
 from typing_extensions import Literal
 
 from langgraph.graph import StateGraph, START, END
-from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage, filter_messages
+from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage, AIMessage
 from langchain.chat_models import init_chat_model
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 
 from state_research import ResearcherState, ResearcherOutputState
-from utils import tavily_search, get_today_str, think_tool
+from utils import tavily_search, get_today_str, think_tool, PROMPTS_DIR
 # from prompts import research_agent_prompt, compress_research_system_prompt, compress_research_human_message
-from PromptManager import PromptManager
+from PromptManager import PromptTemplate, get_prompt_manager
 
 # ===== CONFIGURATION =====
 
 # Set up tools and model binding
 tools = [tavily_search, think_tool]
 tools_by_name = {tool.name: tool for tool in tools}
+# Network-bound tools that can safely run concurrently within one turn
+io_bound_tools = {tavily_search.name}
+
+# Message types kept as raw research notes
+raw_note_types = (ToolMessage, AIMessage)
 
 # Initialize models
 model = init_chat_model(model="openai:gpt-4.1")
@@ -29,6 +38,11 @@ model_with_tools = model.bind_tools(tools)
 summarization_model = init_chat_model(model="openai:gpt-4.1-mini")
 compress_model = init_chat_model(model="openai:gpt-4.1", max_tokens=32000) # model="anthropic:claude-sonnet-4-20250514", max_tokens=64000
 
+@lru_cache(maxsize=None)
+def get_pinned_prompt(name: str, version: str) -> PromptTemplate:
+    """Fetch a pinned prompt version on first use; importing this module touches no files."""
+    return get_prompt_manager(PROMPTS_DIR).get_prompt(name, version)
+
 # ===== AGENT NODES =====
 
 def llm_call(state: ResearcherState):
@@ -40,8 +54,7 @@ def llm_call(state: ResearcherState):
 
     Returns updated state with the model's response.
     """
-    prompt_manager = PromptManager()
-    research_agent_prompt = prompt_manager.get_prompt("research_agent_prompt_user", "v1.0.0").render(date=get_today_str())
+    research_agent_prompt = get_pinned_prompt("research_agent_prompt_user", "v1.0.0").render(date=get_today_str())
     return {
         "researcher_messages": [
             model_with_tools.invoke(
@@ -53,16 +66,29 @@ def llm_call(state: ResearcherState):
 def tool_node(state: ResearcherState):
     """Execute all tool calls from the previous LLM response.
 
-    Executes all tool calls from the previous LLM responses.
+    Executes all tool calls from the previous LLM responses, running
+    network-bound tools (e.g. searches) concurrently.
     Returns updated state with tool execution results.
     """
     tool_calls = state["researcher_messages"][-1].tool_calls
 
-    # Execute all tool calls
-    observations = []
-    for tool_call in tool_calls:
-        tool = tools_by_name[tool_call["name"]]
-        observations.append(tool.invoke(tool_call["args"]))
+    # Execute all tool calls, keeping results in tool call order
+    observations = [None] * len(tool_calls)
+    io_calls = [i for i, tool_call in enumerate(tool_calls) if tool_call["name"] in io_bound_tools]
+    with ContextThreadPoolExecutor(max_workers=max(len(io_calls), 1)) as executor:
+        futures = {
+            executor.submit(tools_by_name[tool_calls[i]["name"]].invoke, tool_calls[i]["args"]): i
+            for i in io_calls
+        }
+
+        # Run the cheap local tools while the searches are in flight
+        for i, tool_call in enumerate(tool_calls):
+            if tool_call["name"] not in io_bound_tools:
+                tool = tools_by_name[tool_call["name"]]
+                observations[i] = tool.invoke(tool_call["args"])
+
+        for future in as_completed(futures):
+            observations[futures[future]] = future.result()
 
     # Create tool message outputs
     tool_outputs = [
@@ -81,19 +107,15 @@ def compress_research(state: ResearcherState) -> dict:
     Takes all the research messages and tool outputs and creates
     a compressed summary suitable for the supervisor's decision-making.
     """
-    prompt_manager = PromptManager()
-    compress_research_system_prompt = prompt_manager.get_prompt("compress_research_prompt_system", "v1.0.0")
-    system_message = compress_research_system_prompt.render(date=get_today_str())
-    compress_research_human_message = prompt_manager.get_prompt("compress_research_prompt_user", "v1.0.0").render(research_topic=state["research_topic"])
+    system_message = get_pinned_prompt("compress_research_prompt_system", "v1.0.0").render(date=get_today_str())
+    compress_research_human_message = get_pinned_prompt("compress_research_prompt_user", "v1.0.0").render(research_topic=state["research_topic"])
     messages = [SystemMessage(content=system_message)] + state.get("researcher_messages", []) + [HumanMessage(content=compress_research_human_message)]
     response = compress_model.invoke(messages)
 
     # Extract raw notes from tool and AI messages
     raw_notes = [
-        str(m.content) for m in filter_messages(
-            state["researcher_messages"], 
-            include_types=["tool", "ai"]
-        )
+        str(m.content) for m in state["researcher_messages"]
+        if isinstance(m, raw_note_types)
     ]
 
     return {
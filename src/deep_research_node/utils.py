@@ -6,7 +6,8 @@ including web search capabilities and content summarization tools.
 """
 
 from pathlib import Path
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 from typing_extensions import Annotated, List, Literal
 import os
 
@@ -18,14 +19,19 @@ from tavily import TavilyClient
 
 from state_research import Summary
 # from prompts import summarize_webpage_prompt
-from PromptManager import PromptManager
+from PromptManager import get_prompt_manager
 
 
 # ===== UTILITY FUNCTIONS =====
 
 def get_today_str() -> str:
     """Get current date in a human-readable format."""
-    return datetime.now().strftime("%a %b %-d, %Y")
+    return _format_day(date.today().toordinal())
+
+@lru_cache(maxsize=2)
+def _format_day(ordinal: int) -> str:
+    """Format a day once so every call that day returns the same string."""
+    return date.fromordinal(ordinal).strftime("%a %b %-d, %Y")
 
 def get_current_dir() -> Path:
     """Get the current directory of the module.
@@ -42,6 +48,9 @@ def get_current_dir() -> Path:
 
 # ===== CONFIGURATION =====
 
+# Prompt files live at the repository root, independent of the working directory
+PROMPTS_DIR = str(get_current_dir().parent.parent / "prompts")
+
 summarization_model = init_chat_model(model="openai:gpt-4.1-mini", api_key=os.environ.get('OPENAI_API_KEY'))
 tavily_client = TavilyClient(os.environ.get('TAVILY_API_KEY'))
 
@@ -88,7 +97,7 @@ def summarize_webpage_content(webpage_content: str) -> str:
         Formatted summary with key excerpts
     """
     try:
-        prompt_manager = PromptManager()
+        prompt_manager = get_prompt_manager(PROMPTS_DIR)
         summarize_webpage_prompt = prompt_manager.get_prompt("summarize_webpage_prompt_user", "v1.0.0")
         # Set up structured output model for summarization
         structured_model = summarization_model.with_structured_output(Summary)